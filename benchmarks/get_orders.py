@@ -0,0 +1,75 @@
+"""Benchmark ``get_orders`` end to end against an offline replay.
+
+Runs ``get_orders`` headless against a recorded HAR archive or a saved orders
+page, with no loading delay, and reports each phase's timings over several runs.
+
+Usage:
+    python benchmarks/get_orders.py [--runs 10] [--replay PATH] [--base-url URL]
+"""
+
+import argparse
+import statistics
+import tempfile
+from collections import defaultdict
+from pathlib import Path
+
+from target_orders.data_models import DataModel
+from target_orders.main import console, get_orders, target_urls
+
+SAMPLE_PAGE = Path(__file__).parents[1] / "tests/fixtures/sample_orders_page.html"
+
+
+def _positive_int(value: str) -> int:
+    runs = int(value)
+    if runs < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not at least 1")
+    return runs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=_positive_int, default=10)
+    parser.add_argument("--replay", type=Path, default=SAMPLE_PAGE)
+    parser.add_argument(
+        "--base-url",
+        help="Base URL to serve the replay at, defaults to the live site's",
+    )
+    args = parser.parse_args()
+
+    urls = target_urls
+    if args.base_url is not None:
+        urls = urls.with_base(args.base_url)
+    console.quiet = True
+
+    timings: defaultdict[str, list[float]] = defaultdict(list)
+    order_count = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        storage_state = Path(tmp) / "storage_state.json"
+        DataModel(cookies=[], origins=[]).write_file(storage_state)
+        for _ in range(args.runs):
+            run: dict[str, float] = {}
+            order_count = len(
+                get_orders(
+                    storage_state,
+                    loading_delay=0,
+                    headless=True,
+                    urls=urls,
+                    replay=args.replay,
+                    timings=run,
+                )
+            )
+            run["total"] = sum(run.values())
+            for phase, seconds in run.items():
+                timings[phase].append(seconds)
+
+    print(f"{order_count} orders, {args.runs} runs (ms)")
+    print(f"{'phase':<15} {'min':>8} {'median':>8} {'max':>8}")
+    for phase, samples in timings.items():
+        print(
+            f"{phase:<15} {min(samples) * 1000:8.1f}"
+            f" {statistics.median(samples) * 1000:8.1f} {max(samples) * 1000:8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark loading saved orders files.
+
+Compares full ``Orders.model_validate_json`` against the streaming loader,
+with and without field projection, reporting wall time and peak traced memory.
+
+Usage:
+    python benchmarks/load_orders.py [--orders 100000]
+"""
+
+import argparse
+import gc
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from target_orders.loaders import iter_orders, load_orders
+from target_orders.models import Orders
+
+SUMMARY_FIELDS = ["order_number", "order_date", "order_total"]
+
+
+def make_orders(count: int) -> Orders:
+    return Orders.model_validate(
+        [
+            {
+                "order_date": f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+                "order_total": f"{i % 500}.{i % 100:02d}",
+                "order_number": f"{9_000_000 + i}",
+                "order_url": f"/orders/{9_000_000 + i}",
+                "delivery_status": "Delivered",
+                "items": [
+                    {
+                        "name": f"Item {i}-{j}",
+                        "image_url": f"https://target.scene7.com/is/image/Target/GUEST_{i}_{j}",
+                    }
+                    for j in range(3)
+                ],
+            }
+            for i in range(count)
+        ]
+    )
+
+
+def measure(name: str, func: Callable[[], Any]) -> None:
+    # Timed and traced separately, since tracing slows allocation down.
+    gc.collect()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<40} {elapsed:8.2f} s {peak / 2**20:10.1f} MiB")
+
+
+def drain(iterable: Any) -> None:
+    for _ in iterable:
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=100_000)
+    args = parser.parse_args()
+
+    orders = make_orders(args.orders)
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "orders.json"
+        ndjson_path = Path(tmp) / "orders.ndjson"
+        json_path.write_text(orders.model_dump_json(indent=4), encoding="utf-8")
+        with ndjson_path.open("w", encoding="utf-8") as f:
+            for order in orders:
+                f.write(order.model_dump_json() + "\n")
+        del orders
+
+        print(f"{args.orders} orders, {json_path.stat().st_size / 2**20:.1f} MiB JSON")
+        measure(
+            "Orders.model_validate_json",
+            lambda: Orders.model_validate_json(json_path.read_text(encoding="utf-8")),
+        )
+        measure("load_orders (JSON)", lambda: load_orders(json_path))
+        measure("load_orders (NDJSON)", lambda: load_orders(ndjson_path))
+        measure("iter_orders (JSON, streamed)", lambda: drain(iter_orders(json_path)))
+        measure(
+            "iter_orders (JSON, summary fields)",
+            lambda: drain(iter_orders(json_path, fields=SUMMARY_FIELDS)),
+        )
+        measure(
+            "iter_orders (NDJSON, summary fields)",
+            lambda: drain(iter_orders(ndjson_path, fields=SUMMARY_FIELDS)),
+        )
+
+
+if __name__ == "__main__":
+    main()
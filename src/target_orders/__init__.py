@@ -1,4 +1,11 @@
+from .loaders import iter_orders, load_orders, write_orders
 from .main import get_orders
 from .models import parse_orders_from_html
 
-__all__ = ["get_orders", "parse_orders_from_html"]
+__all__ = [
+    "get_orders",
+    "iter_orders",
+    "load_orders",
+    "parse_orders_from_html",
+    "write_orders",
+]
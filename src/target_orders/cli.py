@@ -1,10 +1,15 @@
+import os
+import tempfile
 from pathlib import Path
 from typing import Annotated
 
 import typer
+from pydantic import ValidationError
 from rich.console import Console
 
+from target_orders.loaders import DEFAULT_BATCH_SIZE, iter_orders, write_orders
 from target_orders.main import get_orders as get_orders_from_target
+from target_orders.main import target_urls
 from target_orders.models import parse_orders_from_html
 
 app = typer.Typer(rich_markup_mode="rich")
@@ -49,11 +54,75 @@ def get_orders(
     output: Annotated[
         Path | None, typer.Option("-o", "--output", dir_okay=False, writable=True)
     ] = None,
+    loading_delay: Annotated[
+        int,
+        typer.Option(
+            "-l",
+            "--loading-delay",
+            help="Seconds to wait for the page to load if no order appears in time",
+            min=0,
+        ),
+    ] = 5,
+    ready_timeout: Annotated[
+        float,
+        typer.Option(
+            "--ready-timeout",
+            help="Seconds to wait for the first order to appear, 0 to skip",
+            min=0,
+        ),
+    ] = 10,
+    replay: Annotated[
+        Path | None,
+        typer.Option(
+            "--replay",
+            help="HAR archive or orders page HTML to serve instead of target.com",
+            exists=True,
+            dir_okay=False,
+        ),
+    ] = None,
+    record_har: Annotated[
+        Path | None,
+        typer.Option(
+            "--record-har",
+            help="Record all traffic to this HAR archive",
+            dir_okay=False,
+            writable=True,
+        ),
+    ] = None,
+    base_url: Annotated[
+        str | None, typer.Option("--base-url", help="Override the site base URL")
+    ] = None,
 ):
     """Get orders from Target.com."""
+    urls = target_urls
+    if base_url is not None:
+        try:
+            urls = target_urls.with_base(base_url)
+        except ValidationError as e:
+            raise typer.BadParameter(
+                f"{base_url!r} is not a valid HTTP URL", param_hint="--base-url"
+            ) from e
+
     console.print("[bold green]Getting orders...[/]")
 
-    orders = get_orders_from_target(cookies_path=cookies)
+    try:
+        orders = get_orders_from_target(
+            cookies_path=cookies,
+            loading_delay=loading_delay,
+            ready_timeout=ready_timeout,
+            headless=headless,
+            urls=urls,
+            replay=replay,
+            record_har=record_har,
+        )
+    except ValidationError:
+        raise
+    except ValueError as e:
+        # Only a manual login conflicts with --headless, and only a replay
+        # with --base-url.
+        raise typer.BadParameter(
+            str(e), param_hint="--headless" if replay is None else "--base-url"
+        ) from e
 
     if output is None:
         console.print(f"[bold green]Found {len(orders)} orders:[/]")
@@ -64,3 +133,61 @@ def get_orders(
         with output.open("w") as f:
             f.write(orders.model_dump_json(indent=4))
         console.print("[bold green]Done[/]")
+
+
+@app.command()
+def load_orders(
+    files: Annotated[
+        list[Path],
+        typer.Argument(
+            help="Saved orders files (JSON array or NDJSON) to load and merge",
+            exists=True,
+            dir_okay=False,
+        ),
+    ],
+    fields: Annotated[
+        list[str] | None,
+        typer.Option("-f", "--field", help="Only load this order field"),
+    ] = None,
+    batch_size: Annotated[
+        int, typer.Option("-b", "--batch-size", min=1)
+    ] = DEFAULT_BATCH_SIZE,
+    output: Annotated[
+        Path | None,
+        typer.Option(
+            "-o",
+            "--output",
+            help="Path to write the merged orders to",
+            dir_okay=False,
+            writable=True,
+        ),
+    ] = None,
+):
+    """Load orders previously saved with [bold]-o[/]."""
+    try:
+        orders = iter_orders(*files, fields=fields, batch_size=batch_size)
+    except KeyError as e:
+        raise typer.BadParameter(e.args[0], param_hint="--field") from e
+
+    if output is None:
+        count = 0
+        for order in orders:
+            console.print(order)
+            count += 1
+        console.print(f"[bold green]Loaded {count} orders[/]")
+    else:
+        console.print(f"[bold green]Saving orders to {output}[/]")
+        output.parent.mkdir(parents=True, exist_ok=True)
+        # The output may be one of the inputs, so only replace it once every
+        # input has been read.
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=output.parent, suffix=".tmp", delete=False
+        ) as f:
+            try:
+                count = write_orders(orders, f)
+            except BaseException:
+                f.close()
+                os.unlink(f.name)
+                raise
+        os.replace(f.name, output)
+        console.print(f"[bold green]Done, saved {count} orders[/]")
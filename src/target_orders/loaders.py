@@ -0,0 +1,404 @@
+import contextlib
+import functools
+import gc
+import itertools
+import json
+import re
+import textwrap
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import IO, Any, TypeVar, overload
+
+from pydantic import BaseModel, TypeAdapter, ValidationError, create_model
+
+from target_orders.models import Order, Orders
+
+DEFAULT_BATCH_SIZE = 1_000
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_T = TypeVar("_T")
+
+_WHITESPACE_RE = re.compile(r"\s*")
+# A decode error this close to the end of the buffer may just mean the object
+# was cut off mid-token: a partial literal ("fals"), number ("1e") or escape.
+_TRUNCATION_MARGIN = 6
+
+
+@functools.cache
+def _projection_model(fields: tuple[str, ...]) -> type[BaseModel]:
+    missing = [field for field in fields if field not in Order.model_fields]
+    if missing:
+        raise KeyError(f"Fields {missing} do not exist for {Order}")
+
+    field_definitions: dict[str, Any] = {
+        field: (Order.model_fields[field].annotation, Order.model_fields[field])
+        for field in fields
+    }
+    return create_model("OrderProjection", **field_definitions)
+
+
+@functools.cache
+def _get_adapter(fields: tuple[str, ...] | None) -> TypeAdapter[list[Any]]:
+    model = Order if fields is None else _projection_model(fields)
+    return TypeAdapter(list[model])  # pyright: ignore[reportInvalidTypeForm]
+
+
+def _is_truncated(error: json.JSONDecodeError) -> bool:
+    return (
+        error.msg.startswith("Unterminated string")
+        or len(error.doc) - error.pos <= _TRUNCATION_MARGIN
+    )
+
+
+def _is_json_error(error: ValidationError) -> bool:
+    return any(detail["type"] == "json_invalid" for detail in error.errors())
+
+
+def _find_cut(buffer: str, start: int) -> int | None:
+    """Find the end of the last complete object in ``buffer[start:]``.
+
+    ``start`` must be the start of an object. Braces are only counted, not
+    parsed, so a brace inside a string can give a wrong cut. A wrong cut always
+    leaves an unclosed object or string behind, so it never validates.
+    """
+    pos = len(buffer)
+    opens = buffer.count("{", start, pos)
+    closes = buffer.count("}", start, pos)
+    while (close := buffer.rfind("}", start, pos)) != -1:
+        opens -= buffer.count("{", close, pos)
+        if opens == closes:
+            return close + 1
+        closes -= 1
+        pos = close
+    return None
+
+
+class _JsonArrayReader:
+    """Incremental reader for the objects of a JSON array.
+
+    Yields JSON arrays of consecutive objects, cut wherever a chunk ends after a
+    complete object, so nothing is parsed before pydantic validates it. When a
+    yielded array turns out not to be valid JSON, ``rewind`` re-reads it one
+    object at a time to find the exact error.
+
+    Args:
+        fp (IO[str]): File object positioned just after the opening ``[``.
+        path (Path): Path of the file, used in error messages.
+        chunk_size (int): Number of characters to read at a time. Doubles while a
+            single object is larger than what has been read so far.
+        offset (int): Position of ``fp`` in the file, used in error messages.
+    """
+
+    def __init__(
+        self,
+        fp: IO[str],
+        path: Path,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        offset: int = 0,
+    ) -> None:
+        self.fp = fp
+        self.path = path
+        self.chunk_size = chunk_size
+        self.offset = offset
+        self.buffer = ""
+        self.pos = 0
+        self._decoder = json.JSONDecoder()
+        self._yielded: int | None = None
+        self._rewound = False
+        self._exact_until = 0
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield JSON arrays holding the next objects.
+
+        Raises:
+            ValueError: If the array is malformed or the file ends inside it.
+        """
+        after_item = False
+        while True:
+            char = self._next_char()
+            if after_item:
+                if char == "]":
+                    return
+                if char != ",":
+                    raise self._error("Expecting ',' delimiter", self.pos)
+                self.pos += 1
+                char = self._next_char()
+            elif char == "]":
+                return
+            if char != "{":
+                raise self._error("Expecting an object", self.pos)
+
+            if self.offset + self.pos < self._exact_until:
+                text = self._read_object()
+            else:
+                text = self._read_objects()
+            # Reading may have dropped consumed text, so the start has moved.
+            self._yielded = self.pos - len(text)
+            yield f"[{text}]"
+            after_item = True
+            if self._rewound:
+                self._rewound = False
+                # Back to the start of the objects, past any comma before them.
+                self.pos = self._yielded
+                after_item = False
+
+    def rewind(self) -> bool:
+        """Re-read the last yielded objects one at a time.
+
+        Returns:
+            bool: False if they were already read one at a time.
+        """
+        assert self._yielded is not None, "Nothing has been yielded yet"
+        start = self._yielded
+        if self.offset + start < self._exact_until:
+            return False
+        self._exact_until = self.offset + self.pos
+        self.pos = start
+        self._rewound = True
+        return True
+
+    def _error(self, msg: str, pos: int) -> ValueError:
+        return ValueError(f"{self.path}: {msg} at character {self.offset + pos}")
+
+    def _eof_error(self) -> ValueError:
+        return ValueError(f"{self.path}: Unexpected end of file inside a JSON array")
+
+    def _read(self, size: int) -> bool:
+        """Append up to ``size`` characters, dropping what was already consumed."""
+        chunk = self.fp.read(size)
+        self.offset += self.pos
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return bool(chunk)
+
+    def _next_char(self) -> str:
+        while True:
+            self.pos = _WHITESPACE_RE.match(self.buffer, self.pos).end()  # pyright: ignore[reportOptionalMemberAccess]
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._read(self.chunk_size):
+                raise self._eof_error()
+
+    def _read_objects(self) -> str:
+        read_size = self.chunk_size
+        while (cut := _find_cut(self.buffer, self.pos)) is None:
+            if not self._read(read_size):
+                # Truncated or malformed, let the exact reader say which.
+                return self._read_object()
+            read_size *= 2
+        text = self.buffer[self.pos : cut]
+        self.pos = cut
+        return text
+
+    def _read_object(self) -> str:
+        read_size = self.chunk_size
+        while True:
+            try:
+                _, end = self._decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                if not _is_truncated(e):
+                    raise self._error(e.msg, e.pos) from e
+                if not self._read(read_size):
+                    if e.pos < len(self.buffer) and not e.msg.startswith(
+                        "Unterminated"
+                    ):
+                        raise self._error(e.msg, e.pos) from e
+                    raise self._eof_error() from e
+                read_size *= 2
+            else:
+                item = self.buffer[self.pos : end]
+                self.pos = end
+                return item
+
+
+def _is_json_object(text: str) -> bool:
+    try:
+        return isinstance(json.loads(text), dict)
+    except json.JSONDecodeError:
+        return False
+
+
+def _iter_ndjson_lines(fp: IO[str]) -> Iterator[tuple[int, str]]:
+    """Yield the line number and text of each non-blank line of an NDJSON file."""
+    for number, line in enumerate(fp, start=1):
+        if line.strip():
+            yield number, line
+
+
+def _validate_ndjson(
+    fp: IO[str], path: Path, adapter: TypeAdapter[list[Any]], batch_size: int
+) -> Iterator[BaseModel]:
+    lines = _iter_ndjson_lines(fp)
+    first = next(lines, None)
+    # A pretty-printed object also starts with "{", but its first line is not
+    # a complete object.
+    if first is None or not _is_json_object(first[1]):
+        raise ValueError(f"{path} is neither a JSON array nor NDJSON")
+
+    for batch in _batched(itertools.chain([first], lines), batch_size):
+        try:
+            orders = adapter.validate_json(f"[{','.join(line for _, line in batch)}]")
+        except ValidationError:
+            _check_lines(path, batch)
+            raise
+        # A line holding "{...}, {...}" still joins into valid JSON.
+        if len(orders) != len(batch):
+            _check_lines(path, batch)
+        yield from orders
+
+
+def _check_lines(path: Path, batch: list[tuple[int, str]]) -> None:
+    for number, line in batch:
+        if not _is_json_object(line):
+            raise ValueError(f"{path}: line {number} is not a single JSON object")
+
+
+def _validate_json_array(
+    reader: _JsonArrayReader, adapter: TypeAdapter[list[Any]]
+) -> Iterator[BaseModel]:
+    for text in reader:
+        try:
+            orders = adapter.validate_json(text)
+        except ValidationError as e:
+            if _is_json_error(e) and reader.rewind():
+                continue
+            raise
+        yield from orders
+
+
+def _iter_file(
+    path: Path, adapter: TypeAdapter[list[Any]], batch_size: int, chunk_size: int
+) -> Iterator[BaseModel]:
+    with path.open(encoding="utf-8") as fp:
+        offset = 1
+        while (first := fp.read(1)).isspace():
+            offset += 1
+        if first == "[":
+            reader = _JsonArrayReader(fp, path, chunk_size=chunk_size, offset=offset)
+            yield from _validate_json_array(reader, adapter)
+        elif first == "{":
+            fp.seek(0)
+            yield from _validate_ndjson(fp, path, adapter, batch_size)
+        elif first:
+            raise ValueError(f"{path} is neither a JSON array nor NDJSON")
+
+
+@contextlib.contextmanager
+def _gc_paused() -> Iterator[None]:
+    # Loaded orders contain no reference cycles, but every batch kept alive
+    # makes each cyclic collection slower while the list grows.
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _batched(iterable: Iterable[_T], n: int) -> Iterator[list[_T]]:
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, n)):
+        yield batch
+
+
+@overload
+def iter_orders(
+    *paths: str | Path,
+    fields: None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Order]: ...
+@overload
+def iter_orders(
+    *paths: str | Path,
+    fields: Sequence[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[BaseModel]: ...
+def iter_orders(
+    *paths: str | Path,
+    fields: Sequence[str] | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[BaseModel]:
+    """Stream orders from saved JSON or NDJSON files.
+
+    Files are read incrementally and validated a batch at a time, so only one
+    batch is held in memory. Several paths are read one after the other, in the
+    order given.
+
+    Args:
+        *paths (str | Path): Files written by ``get-orders -o``/``parse-orders -o``
+            (a JSON array) or NDJSON files with one order per line.
+        fields (Sequence[str] | None): If given, only these ``Order`` fields are
+            validated and the yielded models contain nothing else.
+        batch_size (int): Number of NDJSON lines validated at a time.
+        chunk_size (int): Number of characters read, and validated, at a time
+            from JSON arrays.
+
+    Returns:
+        Iterator[Order | BaseModel]: Orders, or projected orders if ``fields`` is given.
+
+    Raises:
+        KeyError: If one of ``fields`` is not a field of ``Order``.
+        ValueError: While iterating, if a file is not a JSON array or NDJSON, is
+            malformed or is truncated. Also raised as ``pydantic.ValidationError``
+            if an order does not validate.
+    """
+    key = None if fields is None else tuple(dict.fromkeys(fields))
+    # Looked up before iterating, so unknown fields are reported straight away.
+    adapter = _get_adapter(key)
+    return _iter_validated(paths, adapter, batch_size, chunk_size)
+
+
+def _iter_validated(
+    paths: Iterable[str | Path],
+    adapter: TypeAdapter[list[Any]],
+    batch_size: int,
+    chunk_size: int,
+) -> Iterator[BaseModel]:
+    for path in paths:
+        yield from _iter_file(Path(path), adapter, batch_size, chunk_size)
+
+
+def load_orders(
+    *paths: str | Path,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Orders:
+    """Load and merge orders from saved JSON or NDJSON files.
+
+    Args:
+        *paths (str | Path): Files to load, see ``iter_orders``.
+        batch_size (int): Number of NDJSON lines validated at a time.
+        chunk_size (int): Number of characters read at a time from JSON arrays.
+
+    Returns:
+        Orders: All orders from all files, in file order.
+    """
+    with _gc_paused():
+        orders = list(iter_orders(*paths, batch_size=batch_size, chunk_size=chunk_size))
+    return Orders.model_construct(root=orders)
+
+
+def write_orders(orders: Iterable[BaseModel], fp: IO[str]) -> int:
+    """Write orders as a JSON array, one order at a time.
+
+    The output is the same as ``Orders.model_dump_json(indent=4)``, so it can be
+    loaded again with ``load_orders``.
+
+    Args:
+        orders (Iterable[BaseModel]): Orders or projected orders, e.g. from ``iter_orders``.
+        fp (IO[str]): File object to write to.
+
+    Returns:
+        int: The number of orders written.
+    """
+    count = 0
+    for order in orders:
+        fp.write(",\n" if count else "[\n")
+        fp.write(textwrap.indent(order.model_dump_json(indent=4), "    "))
+        count += 1
+    fp.write("\n]" if count else "[]")
+    return count
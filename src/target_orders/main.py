@@ -1,17 +1,22 @@
 import contextlib
 import functools
 import time
+from collections.abc import Iterator
 from os import PathLike
 from pathlib import Path
+from typing import Self
 
 from playwright.sync_api import Browser, BrowserContext, Error, Page, sync_playwright
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from pydantic import AnyHttpUrl, BaseModel
 from rich.console import Console
 from rich.progress import track
 
 from target_orders.models import Orders
+from target_orders.replay import HAR_SUFFIXES, install_replay
 
 BASE_URL = "https://www.target.com/"
+ORDERS_SELECTOR = "div[data-test='order-details-link']"
 
 
 class SiteUrls(BaseModel):
@@ -29,6 +34,14 @@ class SiteUrls(BaseModel):
 
     get_login_url = functools.partialmethod(_get_FOO_url, "relative_login")
 
+    def with_base(self, base: str) -> Self:
+        """Return a copy of these URLs on another site, e.g. a local replay.
+
+        Raises:
+            pydantic.ValidationError: If ``base`` is not a valid HTTP URL.
+        """
+        return self.model_copy(update={"base": AnyHttpUrl(base)})
+
 
 target_urls = SiteUrls(base=BASE_URL, relative_login="login/", orders="orders/")  # pyright: ignore[reportArgumentType]
 login_cookies_path = Path("target_login.json")
@@ -37,14 +50,49 @@ console = Console()
 
 
 def _make_page(
-    browser: Browser, storage_state: Path | None = None
+    browser: Browser,
+    storage_state: Path | None = None,
+    record_har_path: Path | None = None,
 ) -> tuple[BrowserContext, Page]:
-    browser_context = browser.new_context(storage_state=storage_state)
+    browser_context = browser.new_context(
+        storage_state=storage_state, record_har_path=record_har_path
+    )
     page = browser_context.new_page()
 
     return browser_context, page
 
 
+@contextlib.contextmanager
+def _timed(timings: dict[str, float] | None, phase: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if timings is not None:
+            timings[phase] = time.perf_counter() - start
+
+
+def _wait_until_ready(page: Page, *, ready_timeout: float, loading_delay: int) -> None:
+    if ready_timeout > 0:
+        try:
+            page.wait_for_selector(
+                ORDERS_SELECTOR, state="attached", timeout=ready_timeout * 1000
+            )
+        except PlaywrightTimeoutError:
+            console.print(
+                f"[yellow bold]No orders appeared within {ready_timeout} seconds.[/]"
+            )
+        else:
+            return
+
+    for _ in track(
+        range(loading_delay),
+        description="Waiting for purchase history to load...",
+        console=console,
+    ):
+        time.sleep(1)
+
+
 def parse_orders_from_html(html: str | Path, *, debug: bool = False) -> Orders:
     """Parse orders from HTML.
 
@@ -63,47 +111,87 @@ def parse_orders_from_html(html: str | Path, *, debug: bool = False) -> Orders:
         context = browser.new_context()
         page = context.new_page()
         page.set_content(html)
-        orders_div = page.query_selector_all("div[data-test='order-details-link']")
+        orders_div = page.query_selector_all(ORDERS_SELECTOR)
 
     return Orders.parse_elements(orders_div)
 
 
 def get_orders(
-    cookies_path: Path | None = None, *, loading_delay: int = 5, debug: bool = False
+    cookies_path: Path | None = None,
+    *,
+    loading_delay: int = 5,
+    ready_timeout: float = 10,
+    debug: bool = False,
+    headless: bool = False,
+    urls: SiteUrls = target_urls,
+    replay: Path | None = None,
+    record_har: Path | None = None,
+    timings: dict[str, float] | None = None,
 ) -> Orders:
     """Get orders from Target.com.
 
     Args:
         cookies_path (Path | None): Path to the cookies file. If None, a new session will be created.
-        loading_delay (int): Number of seconds to wait for the page to load.
+        loading_delay (int): Number of seconds to wait for the page to load, if no order appeared within `ready_timeout`.
+        ready_timeout (float): Maximum number of seconds to wait for the first order to appear. 0 skips waiting and always waits `loading_delay` instead.
         debug (bool): If True, debug information will be printed and html will be saved to a file.
+        headless (bool): If True, the browser window will not be shown.
+        urls (SiteUrls): The site to get orders from.
+        replay (Path | None): HAR archive or orders page HTML to serve instead of the live site, see `install_replay`. No manual login is done when replaying.
+        record_har (Path | None): If given, all traffic will be recorded to this HAR archive.
+        timings (dict[str, float] | None): If given, the seconds spent in each phase will be stored in it.
 
     Returns:
         Orders: A list of orders.
+
+    Raises:
+        ValueError: If a manual login would be needed but `headless` is set, or if a HAR archive is replayed at other `urls` than the default ones.
     """
+    logged_in = cookies_path is not None and cookies_path.exists()
+    login_manually = not logged_in and replay is None
+    if login_manually and headless:
+        raise ValueError(
+            "Logging in manually needs a browser window, pass an existing cookies_path or headless=False"
+        )
+    if replay is not None and replay.suffix in HAR_SUFFIXES and urls != target_urls:
+        raise ValueError(
+            "A HAR archive is replayed at the URLs it was recorded at, it cannot be served at another base URL"
+        )
+
+    if logged_in:
+        console.print("Loading cookies from file...")
+    elif login_manually:
+        console.print("No cookies found, starting a new session...")
+    else:
+        console.print("No cookies found, replaying without logging in...")
+
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        if cookies_path and cookies_path.exists():
-            console.print("Loading cookies from file...")
-            context, page = _make_page(browser, storage_state=cookies_path)
-        else:
-            console.print("No cookies found, starting a new session...")
-            context, page = _make_page(browser)
-            page.goto(target_urls.get_login_url())
+        with _timed(timings, "launch"):
+            browser = p.chromium.launch(headless=headless)
+            context, page = _make_page(
+                browser,
+                storage_state=cookies_path if logged_in else None,
+                record_har_path=record_har,
+            )
+            if replay is not None:
+                install_replay(context, replay, urls)
+
+        if login_manually:
+            page.goto(urls.get_login_url())
             console.print("Log in manually and then press Enter here...")
             console.input()
 
         console.print("Logged in, now going to purchase history...")
 
         # Go to Purchase History
-        with contextlib.suppress(Error):
-            page.goto(target_urls.get_orders_url())
+        with _timed(timings, "navigation"), contextlib.suppress(Error):
+            page.goto(urls.get_orders_url())
 
         # Wait for the page to load
-        for _ in track(
-            range(loading_delay), description="Waiting for purchase history to load..."
-        ):
-            time.sleep(1)
+        with _timed(timings, "readiness"):
+            _wait_until_ready(
+                page, ready_timeout=ready_timeout, loading_delay=loading_delay
+            )
 
         if debug:
             debug_path = Path("output/")
@@ -113,14 +201,16 @@ def get_orders(
             orders_html_path.write_text(page.content(), encoding="utf-8")
             console.print(f"[yellow bold]Saved orders HTML to {orders_html_path}[/]")
 
-        orders = Orders.parse_elements(
-            page.query_selector_all("div[data-test='order-details-link']")
-        )
+        with _timed(timings, "extraction"):
+            orders = Orders.parse_elements(page.query_selector_all(ORDERS_SELECTOR))
 
         console.print(f"[cyan bold]Found {len(orders)} orders.[/]")
 
         if cookies_path is not None:
-            context.storage_state(path=cookies_path)
+            with _timed(timings, "storage_state"):
+                context.storage_state(path=cookies_path)
+        # Closing the context is what writes out a recorded HAR archive.
+        context.close()
         browser.close()
 
     return orders
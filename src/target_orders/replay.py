@@ -0,0 +1,43 @@
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from playwright.sync_api import BrowserContext, Route
+
+    from target_orders.main import SiteUrls
+
+HAR_SUFFIXES = {".har", ".zip"}
+
+_BLANK_PAGE = "<!DOCTYPE html><html><head></head><body></body></html>"
+
+
+def install_replay(context: "BrowserContext", source: Path, urls: "SiteUrls") -> None:
+    """Serve a recorded site to a browser context instead of the live one.
+
+    HAR archives (``.har`` or ``.zip``, e.g. recorded with ``get_orders(record_har=...)``)
+    are replayed as recorded, so ``urls`` must be the ones they were recorded at. Any other file is treated as a saved orders page and
+    served at the orders URL, alongside a blank login page. In both cases every
+    other request is aborted, so nothing leaves the machine.
+
+    Args:
+        context (BrowserContext): The browser context to route.
+        source (Path): HAR archive or orders page HTML file.
+        urls (SiteUrls): The URLs the orders page and login page are served at.
+    """
+    if source.suffix in HAR_SUFFIXES:
+        context.route_from_har(source, not_found="abort")
+        return
+
+    pages = {
+        urls.get_orders_url(): source.read_text(encoding="utf-8"),
+        urls.get_login_url(): _BLANK_PAGE,
+    }
+
+    def handle(route: "Route") -> None:
+        body = pages.get(route.request.url)
+        if body is None:
+            route.abort()
+        else:
+            route.fulfill(status=200, content_type="text/html", body=body)
+
+    context.route("**/*", handle)
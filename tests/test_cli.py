@@ -0,0 +1,119 @@
+# pyright: standard
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from target_orders import parse_orders_from_html
+from target_orders.cli import app
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def orders_json(tmp_path, sample_html):
+    path = tmp_path / "orders.json"
+    path.write_text(
+        parse_orders_from_html(sample_html).model_dump_json(indent=4),
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_load_orders_output(tmp_path, orders_json):
+    """Test merging saved orders files into a file that loads the same way."""
+    output = tmp_path / "merged.json"
+
+    result = runner.invoke(
+        app, ["load-orders", str(orders_json), str(orders_json), "-o", str(output)]
+    )
+
+    assert result.exit_code == 0, result.output
+    saved = json.loads(orders_json.read_text(encoding="utf-8"))
+    assert json.loads(output.read_text(encoding="utf-8")) == saved * 2
+
+
+def test_load_orders_output_is_input(orders_json):
+    """Test merging into one of the input files reads it in full first."""
+    saved = json.loads(orders_json.read_text(encoding="utf-8"))
+
+    result = runner.invoke(
+        app, ["load-orders", str(orders_json), str(orders_json), "-o", str(orders_json)]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert json.loads(orders_json.read_text(encoding="utf-8")) == saved * 2
+
+
+def test_load_orders_output_kept_on_error(tmp_path, orders_json):
+    """Test a failed merge leaves an existing output untouched."""
+    malformed = tmp_path / "malformed.json"
+    malformed.write_text("[{},,{}]")
+    output = tmp_path / "merged.json"
+    output.write_text("[]")
+
+    result = runner.invoke(
+        app, ["load-orders", str(orders_json), str(malformed), "-o", str(output)]
+    )
+
+    assert result.exit_code != 0
+    assert output.read_text() == "[]"
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "malformed.json",
+        "merged.json",
+        "orders.json",
+    ]
+
+
+def test_load_orders_fields(tmp_path, orders_json):
+    """Test only the requested fields are written."""
+    output = tmp_path / "summary.json"
+
+    result = runner.invoke(
+        app,
+        [
+            "load-orders",
+            str(orders_json),
+            "-f",
+            "order_number",
+            "-f",
+            "order_total",
+            "-o",
+            str(output),
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    saved = json.loads(orders_json.read_text(encoding="utf-8"))
+    assert json.loads(output.read_text(encoding="utf-8")) == [
+        {"order_number": order["order_number"], "order_total": order["order_total"]}
+        for order in saved
+    ]
+
+
+def test_load_orders_unknown_field(orders_json):
+    """Test an unknown field is reported as a bad parameter."""
+    result = runner.invoke(app, ["load-orders", str(orders_json), "-f", "nope"])
+
+    assert result.exit_code == 2
+    assert "--field" in result.output
+
+
+@pytest.mark.parametrize(
+    ("args", "param"),
+    [
+        (["--base-url", "not a url"], "--base-url"),
+        (["--headless"], "--headless"),
+        (["--replay", "{har}", "--base-url", "http://target.test/"], "--base-url"),
+    ],
+)
+def test_get_orders_bad_parameter(tmp_path, args, param):
+    """Test bad get-orders options are reported before a browser is launched."""
+    har = tmp_path / "site.har"
+    har.write_text("{}")
+    args = [arg.format(har=har) for arg in args]
+
+    result = runner.invoke(app, ["get-orders", *args])
+
+    assert result.exit_code == 2
+    assert param in result.output
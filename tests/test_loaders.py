@@ -0,0 +1,149 @@
+# pyright: standard
+import pytest
+
+from target_orders import (
+    iter_orders,
+    load_orders,
+    parse_orders_from_html,
+    write_orders,
+)
+from target_orders.models import Order
+
+
+@pytest.fixture
+def sample_orders(sample_html):
+    return parse_orders_from_html(sample_html)
+
+
+@pytest.fixture
+def orders_json(tmp_path, sample_orders):
+    path = tmp_path / "orders.json"
+    path.write_text(sample_orders.model_dump_json(indent=4), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def orders_ndjson(tmp_path, sample_orders):
+    path = tmp_path / "orders.ndjson"
+    path.write_text(
+        "\n".join(order.model_dump_json() for order in sample_orders) + "\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_load_orders_json(orders_json, sample_orders, chunk_size):
+    """Test streaming a saved JSON array matches full validation."""
+    orders = load_orders(orders_json, batch_size=2, chunk_size=chunk_size)
+    assert list(orders) == list(sample_orders)
+
+
+def test_load_orders_merges_json_and_ndjson(orders_json, orders_ndjson, sample_orders):
+    """Test loading several files of both formats in order."""
+    orders = load_orders(orders_json, orders_ndjson)
+    assert list(orders) == list(sample_orders) * 2
+
+
+def test_iter_orders_fields(orders_json, sample_orders):
+    """Test projecting orders onto a subset of fields."""
+    fields = ["order_number", "order_date", "order_total"]
+    orders = list(iter_orders(orders_json, fields=fields))
+    assert not any(isinstance(order, Order) for order in orders)
+    assert [order.model_dump() for order in orders] == [
+        order.model_dump(include=set(fields)) for order in sample_orders
+    ]
+
+
+def test_iter_orders_unknown_field(orders_json):
+    """Test projecting onto a field that does not exist."""
+    with pytest.raises(KeyError):
+        list(iter_orders(orders_json, fields=["not_a_field"]))
+
+
+def test_load_orders_truncated(tmp_path, orders_json):
+    """Test a truncated JSON array is reported."""
+    truncated = tmp_path / "truncated.json"
+    truncated.write_text(orders_json.read_text(encoding="utf-8")[:-20])
+    with pytest.raises(ValueError, match="Unexpected end of file"):
+        load_orders(truncated)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "[,{}]",
+        "[{}{}]",
+        "[{},,{}]",
+        "[{},]",
+        "[1]",
+        '[{"order_number": nope}, {}]',
+    ],
+)
+def test_load_orders_malformed(tmp_path, sample_orders, text):
+    """Test malformed arrays are rejected rather than skipped over."""
+    path = tmp_path / "malformed.json"
+    path.write_text(text.replace("{}", sample_orders[0].model_dump_json()))
+    with pytest.raises(ValueError, match="at character"):
+        load_orders(path)
+
+
+def test_load_orders_braces_in_strings(tmp_path, sample_orders):
+    """Test braces inside strings do not split an array in the wrong place."""
+    orders = [
+        order.model_copy(update={"delivery_status": "{ } }} {"})
+        for order in sample_orders
+    ]
+    path = tmp_path / "orders.json"
+    path.write_text(
+        "[" + ",".join(order.model_dump_json() for order in orders) + "]",
+        encoding="utf-8",
+    )
+    assert list(load_orders(path, chunk_size=64)) == orders
+
+
+@pytest.mark.parametrize(
+    ("text", "line"),
+    [
+        ("{}\n{}, {}\n", 2),
+        ("{}\n\n[{}]\n", 3),
+        ("{}\n{}\n{\n", 3),
+    ],
+)
+def test_load_orders_bad_ndjson_line(tmp_path, sample_orders, text, line):
+    """Test a line that is not exactly one object is reported by number."""
+    path = tmp_path / "malformed.ndjson"
+    path.write_text(text.replace("{}", sample_orders[0].model_dump_json()))
+    with pytest.raises(ValueError, match=f"line {line} is not a single JSON object"):
+        load_orders(path)
+
+
+def test_load_orders_ndjson_leading_blank_lines(tmp_path, orders_ndjson, sample_orders):
+    """Test blank lines before the first order are skipped."""
+    path = tmp_path / "orders.ndjson"
+    path.write_text("\n \n" + orders_ndjson.read_text(encoding="utf-8"))
+    assert list(load_orders(path)) == list(sample_orders)
+
+
+def test_load_orders_large_object(tmp_path, sample_orders):
+    """Test an object larger than the chunk size is read in full."""
+    path = tmp_path / "orders.json"
+    path.write_text(sample_orders.model_dump_json(), encoding="utf-8")
+    orders = load_orders(path, chunk_size=16)
+    assert list(orders) == list(sample_orders)
+
+
+def test_load_orders_pretty_object(tmp_path, sample_orders):
+    """Test a single pretty-printed object is not mistaken for NDJSON."""
+    path = tmp_path / "order.json"
+    path.write_text(sample_orders[0].model_dump_json(indent=4), encoding="utf-8")
+    with pytest.raises(ValueError, match="neither a JSON array nor NDJSON"):
+        load_orders(path)
+
+
+def test_write_orders(tmp_path, orders_json, sample_orders):
+    """Test writing orders one at a time matches dumping them all at once."""
+    path = tmp_path / "written.json"
+    with path.open("w", encoding="utf-8") as f:
+        assert write_orders(iter_orders(orders_json), f) == len(sample_orders)
+    assert path.read_text(encoding="utf-8") == orders_json.read_text(encoding="utf-8")
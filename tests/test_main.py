@@ -0,0 +1,81 @@
+# pyright: standard
+from pathlib import Path
+
+import pytest
+from playwright.sync_api import sync_playwright
+
+from target_orders import get_orders, parse_orders_from_html
+from target_orders.data_models import DataModel
+from target_orders.main import target_urls
+
+
+@pytest.fixture
+def chromium():
+    with sync_playwright() as p:
+        installed = Path(p.chromium.executable_path).exists()
+    if not installed:
+        pytest.skip("Chromium is not installed for Playwright")
+
+
+@pytest.fixture
+def storage_state(tmp_path):
+    path = tmp_path / "storage_state.json"
+    DataModel(cookies=[], origins=[]).write_file(path)
+    return path
+
+
+@pytest.mark.usefixtures("chromium")
+def test_get_orders_replay(sample_html, storage_state):
+    """Test getting orders offline from a replayed orders page."""
+    urls = target_urls.with_base("http://target.test/")
+    timings: dict[str, float] = {}
+
+    orders = get_orders(
+        storage_state,
+        loading_delay=0,
+        headless=True,
+        urls=urls,
+        replay=sample_html,
+        timings=timings,
+    )
+
+    expected = parse_orders_from_html(sample_html)
+    assert [order.order_number for order in orders] == [
+        order.order_number for order in expected
+    ]
+    assert set(timings) == {
+        "launch",
+        "navigation",
+        "readiness",
+        "extraction",
+        "storage_state",
+    }
+    DataModel.from_file(storage_state)
+
+
+@pytest.mark.usefixtures("chromium")
+def test_get_orders_replay_without_cookies(sample_html):
+    """Test replaying needs neither cookies nor a manual login."""
+    orders = get_orders(
+        loading_delay=0,
+        headless=True,
+        urls=target_urls.with_base("http://target.test/"),
+        replay=sample_html,
+    )
+
+    assert len(orders) == len(parse_orders_from_html(sample_html))
+
+
+def test_get_orders_headless_needs_cookies(tmp_path):
+    """Test a manual login is refused up front when there is no window."""
+    with pytest.raises(ValueError, match="browser window"):
+        get_orders(tmp_path / "missing.json", headless=True)
+
+
+def test_get_orders_har_at_other_base(tmp_path):
+    """Test a HAR replay is refused at a base URL it was not recorded at."""
+    with pytest.raises(ValueError, match="HAR archive"):
+        get_orders(
+            replay=tmp_path / "site.har",
+            urls=target_urls.with_base("http://target.test/"),
+        )